@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Сборка статических ресурсов курса
+
+Минифицирует CSS/JS из static/, добавляет в имя файла хеш содержимого
+и рядом кладет предсжатые .gz/.br версии. Результат пишется в static/dist/
+вместе с manifest.json, по которому приложение подставляет адреса в шаблон.
+
+Запуск:
+    python assets.py
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import re
+import stat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # brotli необязателен: без него собираются только .gz
+    brotli = None
+
+SOURCE_DIR = Path("static")
+DIST_DIR = SOURCE_DIR / "dist"
+MANIFEST_PATH = DIST_DIR / "manifest.json"
+
+# Ресурсы, которые подключаются из шаблона
+ASSET_FILES = ["style.css", "app.css", "app.js"]
+
+# Сжимать имеет смысл только текстовые ресурсы
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".html", ".json", ".svg", ".txt"}
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Имя собранного файла: <имя>.<12 hex-символов хеша>.<расширение>
+FINGERPRINTED_NAME = re.compile(r'\.[0-9a-f]{12}\.[^/]+$')
+
+
+def minify_css(text: str) -> str:
+    """Удаляет комментарии и лишние пробелы из CSS"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,>])\s*', r'\1', text)
+    text = re.sub(r':\s+', ':', text)
+    text = text.replace(';}', '}')
+    return text.strip()
+
+
+def _scan_js_line(line: str, stack: List[str]):
+    """Обновляет стек открытых шаблонных строк и подстановок ${...}
+
+    В стеке лежат '`' (внутри шаблонной строки) и '{' (внутри ${...}
+    или обычных скобок в подстановке). Обычные строки и комментарии
+    на одной строке пропускаются, чтобы кавычки в них не сбивали разбор.
+    """
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if stack and stack[-1] == '`':
+            if char == '\\':
+                i += 1
+            elif char == '`':
+                stack.pop()
+            elif line.startswith('${', i):
+                stack.append('{')
+                i += 1
+        elif char in '\'"':
+            i += 1
+            while i < len(line) and line[i] != char:
+                if line[i] == '\\':
+                    i += 1
+                i += 1
+        elif line.startswith('//', i):
+            break
+        elif char == '`':
+            stack.append('`')
+        elif char == '{' and stack:
+            stack.append('{')
+        elif char == '}' and stack:
+            stack.pop()
+        i += 1
+
+
+def minify_js(text: str) -> str:
+    """Удаляет отступы, пустые строки и строчные комментарии из JS
+
+    Минификация консервативная: строки не склеиваются, чтобы не ломать
+    автоматическую расстановку точек с запятой, а строки внутри
+    многострочных шаблонных литералов остаются без изменений.
+    """
+    lines = []
+    stack: List[str] = []
+    for line in text.splitlines():
+        starts_in_template = bool(stack) and stack[-1] == '`'
+        _scan_js_line(line, stack)
+        if starts_in_template:
+            lines.append(line)
+            continue
+
+        # Хвостовые пробелы строки, открывающей шаблонный литерал, — часть строки
+        ends_in_template = bool(stack) and stack[-1] == '`'
+        line = line.lstrip() if ends_in_template else line.strip()
+        if not line or line.startswith('//'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+MINIFIERS = {
+    ".css": minify_css,
+    ".js": minify_js,
+}
+
+
+def fingerprint(content: bytes) -> str:
+    """Короткий хеш содержимого для имени файла"""
+    return hashlib.sha256(content).hexdigest()[:12]
+
+
+def write_precompressed(path: Path) -> List[Path]:
+    """Создает .gz и .br рядом с файлом, если сжатие дает выигрыш"""
+    if path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return []
+
+    content = path.read_bytes()
+    variants = [(".gz", gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(content, quality=11)))
+
+    written = []
+    for suffix, compressed in variants:
+        if len(compressed) >= len(content):
+            continue
+        target = path.with_name(path.name + suffix)
+        target.write_bytes(compressed)
+        written.append(target)
+    return written
+
+
+def build_assets(source_dir: Path = SOURCE_DIR, dist_dir: Path = DIST_DIR) -> Dict[str, str]:
+    """Собирает ресурсы и возвращает манифест: исходное имя -> URL"""
+    dist_dir.mkdir(parents=True, exist_ok=True)
+
+    # Убираем результаты прошлой сборки, чтобы не копились старые версии
+    for old_file in dist_dir.iterdir():
+        if old_file.is_file():
+            old_file.unlink()
+
+    manifest = {}
+    for name in ASSET_FILES:
+        source = source_dir / name
+        text = source.read_text(encoding='utf-8')
+        minify = MINIFIERS.get(source.suffix)
+        if minify:
+            text = minify(text)
+        content = text.encode('utf-8')
+
+        hashed_name = f"{source.stem}.{fingerprint(content)}{source.suffix}"
+        target = dist_dir / hashed_name
+        target.write_bytes(content)
+        write_precompressed(target)
+
+        manifest[name] = f"/static/dist/{hashed_name}"
+
+    with open(dist_dir / "manifest.json", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return manifest
+
+
+def load_asset_manifest(path: Path = MANIFEST_PATH) -> Dict[str, str]:
+    """Загружает манифест собранных ресурсов (пустой, если сборки не было)"""
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def asset_url_factory(manifest: Dict[str, str]):
+    """Возвращает функцию для шаблона, подставляющую адрес ресурса"""
+    def asset_url(name: str) -> str:
+        return manifest.get(name, f"/static/{name}")
+    return asset_url
+
+
+def accepted_encodings(scope: Scope) -> Dict[str, float]:
+    """Разбирает Accept-Encoding из запроса: кодировка -> q-значение"""
+    accepted = {}
+    for key, value in scope.get("headers", []):
+        if key != b"accept-encoding":
+            continue
+        for part in value.decode('latin-1').lower().split(','):
+            encoding, *params = [item.strip() for item in part.split(';')]
+            if not encoding:
+                continue
+            quality = 1.0
+            for param in params:
+                name, _, number = param.partition('=')
+                if name.strip() == 'q':
+                    try:
+                        quality = float(number)
+                    except ValueError:
+                        quality = 0.0
+            accepted[encoding] = quality
+    return accepted
+
+
+def encoding_quality(accepted: Dict[str, float], encoding: str) -> float:
+    """q-значение кодировки с учетом '*'"""
+    if encoding in accepted:
+        return accepted[encoding]
+    return accepted.get('*', 0.0)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Отдает предсжатые версии файлов и кеширует их навсегда
+
+    Кеширование навсегда включается только для файлов с хешем в имени.
+    """
+
+    encodings: List[Tuple[str, str]] = [("br", ".br"), ("gzip", ".gz")]
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = None
+        if scope["method"] in ("GET", "HEAD"):
+            response = await self.precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if FINGERPRINTED_NAME.search(path):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def precompressed_response(self, path: str, scope: Scope) -> Optional[Response]:
+        """Ищет сжатую версию файла в лучшей из принимаемых клиентом кодировок"""
+        accepted = accepted_encodings(scope)
+        candidates = [
+            (encoding, suffix)
+            for encoding, suffix in self.encodings
+            if encoding_quality(accepted, encoding) > 0
+        ]
+        # При равных q-значениях сохраняется порядок предпочтения из self.encodings
+        candidates.sort(key=lambda candidate: -encoding_quality(accepted, candidate[0]))
+
+        for encoding, suffix in candidates:
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            # Тип содержимого берем по исходному имени, а не по .gz/.br
+            media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=media_type,
+                method=scope["method"],
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, Headers(scope=scope)):
+                return NotModifiedResponse(response.headers)
+            return response
+
+        return None
+
+
+if __name__ == "__main__":
+    result = build_assets()
+    for source_name, url in result.items():
+        print(f"✅ {source_name} -> {url}")
+    if brotli is None:
+        print("ℹ️  Модуль brotli не установлен, созданы только .gz версии")
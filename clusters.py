@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Кластеризация похожих ответов на задания
+
+Каждый ответ разбивается на токены (для кода — модулем tokenize),
+превращается в MinHash-сигнатуру и раскладывается по LSH-корзинам своего
+задания. Похожие ответы попадают в общие корзины и объединяются в кластер,
+поэтому добавление ответа не требует сравнения со всеми предыдущими.
+"""
+import hashlib
+import io
+import random
+import re
+import tokenize
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Параметры MinHash/LSH: BANDS * ROWS = NUM_PERM.
+# При пороге 0.5 вероятность попасть в общую корзину ~0.65,
+# при сходстве 0.8 — больше 0.999
+NUM_PERM = 64
+BANDS = 16
+ROWS = 4
+
+# Минимальная оценка сходства (Жаккара) для объединения в кластер
+SIMILARITY_THRESHOLD = 0.5
+
+# Сколько различных примеров ответов хранить в кластере
+MAX_SAMPLES = 5
+
+# Максимальная длина ответа: дальше ответ не хешируется и не сохраняется
+MAX_ANSWER_LENGTH = 500
+
+# Сколько кластеров хранить на задание: новые ответы, не похожие
+# ни на один кластер, сверх этого лимита не учитываются
+MAX_CLUSTERS_PER_TASK = 1000
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(42)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+# Служебные токены, которые не несут смысла ответа
+_SKIPPED_TOKENS = {
+    tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT,
+    tokenize.COMMENT, tokenize.ENDMARKER, tokenize.ENCODING,
+}
+
+
+def tokenize_answer(text: str) -> List[str]:
+    """Разбивает ответ на токены
+
+    Ответ сначала разбирается как Python-код; если это не получается
+    (обычный текст, незакрытые кавычки), используется разбиение на слова.
+    """
+    text = text.strip().lower()
+    try:
+        tokens = [
+            token.string
+            for token in tokenize.generate_tokens(io.StringIO(text).readline)
+            if token.type not in _SKIPPED_TOKENS and token.type != tokenize.ERRORTOKEN
+        ]
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        tokens = re.findall(r'\w+|[^\w\s]', text)
+    return [token for token in tokens if token.strip()]
+
+
+def shingles(tokens: List[str]) -> Set[str]:
+    """Множество униграмм и биграмм токенов"""
+    result = set(tokens)
+    result.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return result
+
+
+def minhash(features: Set[str]) -> Tuple[int, ...]:
+    """Вычисляет MinHash-сигнатуру множества"""
+    if not features:
+        return (_MAX_HASH,) * NUM_PERM
+
+    hashes = [
+        int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+        for feature in features
+    ]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def estimate_similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Оценка сходства Жаккара по двум сигнатурам"""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERM
+
+
+def band_keys(signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+    """Разбивает сигнатуру на полосы для LSH-корзин"""
+    return [signature[i * ROWS:(i + 1) * ROWS] for i in range(BANDS)]
+
+
+class AnswerCluster:
+    """Группа похожих ответов на одно задание
+
+    Представитель и примеры берутся только из неверных ответов:
+    кластер показывается преподавателю как типичная ошибка.
+    """
+
+    def __init__(self, cluster_id: int, signature: Tuple[int, ...]):
+        self.id = cluster_id
+        self.signature = signature
+        self.representative = ""
+        self.count = 0
+        self.wrong_count = 0
+        self.samples: List[str] = []
+
+    def add(self, answer: str, correct: bool):
+        self.count += 1
+        if correct:
+            return
+
+        self.wrong_count += 1
+        if self.wrong_count == 1:
+            self.representative = answer
+        if answer not in self.samples and len(self.samples) < MAX_SAMPLES:
+            self.samples.append(answer)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "representative": self.representative,
+            "count": self.count,
+            "wrong_count": self.wrong_count,
+            "samples": list(self.samples),
+        }
+
+
+class TaskAnswerIndex:
+    """LSH-индекс ответов одного задания"""
+
+    def __init__(self):
+        self.clusters: List[AnswerCluster] = []
+        # Корзины по полосам: ключ полосы -> id кластера
+        self.buckets: List[Dict[Tuple[int, ...], int]] = [{} for _ in range(BANDS)]
+
+    def add(self, answer: str, correct: bool) -> Optional[AnswerCluster]:
+        """Добавляет ответ и возвращает кластер, в который он попал
+
+        Возвращает None, если кластер нужно создать, а лимит уже исчерпан.
+        """
+        answer = answer[:MAX_ANSWER_LENGTH]
+        signature = minhash(shingles(tokenize_answer(answer)))
+        keys = band_keys(signature)
+
+        cluster = self._find_cluster(signature, keys)
+        if cluster is None:
+            if len(self.clusters) >= MAX_CLUSTERS_PER_TASK:
+                return None
+            cluster = AnswerCluster(len(self.clusters), signature)
+            self.clusters.append(cluster)
+
+        for band, key in enumerate(keys):
+            self.buckets[band].setdefault(key, cluster.id)
+
+        cluster.add(answer, correct)
+        return cluster
+
+    def _find_cluster(self, signature: Tuple[int, ...], keys: List[Tuple[int, ...]]) -> Optional[AnswerCluster]:
+        """Ищет самый похожий кластер среди кандидатов из общих корзин"""
+        candidates = {
+            self.buckets[band][key]
+            for band, key in enumerate(keys)
+            if key in self.buckets[band]
+        }
+
+        best, best_similarity = None, SIMILARITY_THRESHOLD
+        for cluster_id in candidates:
+            cluster = self.clusters[cluster_id]
+            similarity = estimate_similarity(signature, cluster.signature)
+            if similarity >= best_similarity:
+                best, best_similarity = cluster, similarity
+        return best
+
+
+class AnswerClusterer:
+    """Онлайн-кластеризация ответов по всем заданиям"""
+
+    def __init__(self):
+        self.tasks: Dict[str, TaskAnswerIndex] = {}
+
+    def add(self, task_id: str, answer: str, correct: bool) -> Optional[AnswerCluster]:
+        """Добавляет ответ на задание"""
+        index = self.tasks.setdefault(task_id, TaskAnswerIndex())
+        return index.add(answer, correct)
+
+    def top_wrong_clusters(self, task_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Кластеры неверных ответов задания, от самых частых"""
+        index = self.tasks.get(task_id)
+        if index is None:
+            return []
+
+        clusters = [cluster for cluster in index.clusters if cluster.wrong_count > 0]
+        clusters.sort(key=lambda cluster: (-cluster.wrong_count, cluster.id))
+        return [cluster.to_dict() for cluster in clusters[:limit]]
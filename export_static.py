@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Экспорт курса в статический сайт
+
+Пререндерит главную страницу и все GET-ответы API для чтения курса
+в дерево файлов, которое может раздавать любой статический сервер.
+На Python-приложении остается только проверка ответов (POST /api/check-answer).
+
+Адрес /api/... сохраняется в файл api/....json, главная страница — в index.html.
+Рядом с каждым текстовым файлом кладутся сжатые .gz/.br версии.
+
+Запуск:
+    python export_static.py [каталог]   # по умолчанию public/
+"""
+import asyncio
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict
+
+from fastapi.responses import JSONResponse
+
+from assets import COMPRESSIBLE_SUFFIXES, SOURCE_DIR, asset_url_factory, build_assets, write_precompressed
+from main import (
+    COURSE_DATA,
+    get_lesson,
+    get_lesson_by_index,
+    get_lesson_tasks,
+    get_lesson_theory,
+    get_lessons,
+    get_modules,
+    templates,
+)
+
+OUTPUT_DIR = Path("public")
+
+# Файл-метка: каталог с ней создан экспортом, и его можно перезаписать
+EXPORT_MARKER = ".course-export"
+
+
+def render_index(manifest: Dict[str, str]) -> bytes:
+    """Рендерит главную страницу так же, как read_root"""
+    template = templates.get_template("index.html")
+    html = template.render(
+        request={},
+        modules=COURSE_DATA["modules"],
+        lessons=COURSE_DATA["lessons"],
+        asset_url=asset_url_factory(manifest),
+    )
+    return html.encode('utf-8')
+
+
+def render_api() -> Dict[str, bytes]:
+    """Вызывает обработчики API и возвращает тела ответов по адресам"""
+    async def collect():
+        responses = {
+            "/api/modules": await get_modules(),
+            "/api/lessons": await get_lessons(),
+        }
+        for index, lesson in enumerate(COURSE_DATA["lessons"]):
+            lesson_id = lesson["id"]
+            responses[f"/api/lessons/{lesson_id}"] = await get_lesson(lesson_id)
+            responses[f"/api/lessons/by-index/{index}"] = await get_lesson_by_index(index)
+            responses[f"/api/lesson/{lesson_id}/theory"] = await get_lesson_theory(lesson_id)
+            responses[f"/api/lesson/{lesson_id}/tasks"] = await get_lesson_tasks(lesson_id)
+        return responses
+
+    # Сериализуем тем же классом ответа, что и FastAPI
+    return {url: JSONResponse(data).body for url, data in asyncio.run(collect()).items()}
+
+
+def url_to_path(output_dir: Path, url: str) -> Path:
+    """Преобразует адрес API в путь файла: /api/modules -> api/modules.json"""
+    return output_dir / (url.lstrip('/') + ".json")
+
+
+def check_output_dir(output_dir: Path):
+    """Проверяет, что каталог можно очистить под экспорт"""
+    target = output_dir.resolve()
+    cwd = Path.cwd().resolve()
+    static_dir = SOURCE_DIR.resolve()
+
+    if target == cwd or target in cwd.parents:
+        raise ValueError(f"Нельзя экспортировать в текущий каталог или его родителя: {output_dir}")
+    if target == static_dir or static_dir in target.parents:
+        raise ValueError(f"Нельзя экспортировать в каталог статики: {output_dir}")
+    if not output_dir.exists():
+        return
+    if not output_dir.is_dir():
+        raise ValueError(f"Путь существует и не является каталогом: {output_dir}")
+    if any(output_dir.iterdir()) and not (output_dir / EXPORT_MARKER).exists():
+        raise ValueError(f"Каталог не пуст и не создан экспортом: {output_dir}")
+
+
+def export_site(output_dir: Path = OUTPUT_DIR) -> int:
+    """Экспортирует сайт и возвращает количество пререндеренных страниц"""
+    check_output_dir(output_dir)
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+    (output_dir / EXPORT_MARKER).touch()
+
+    # Статика: исходные файлы и ресурсы, собранные прямо в экспорт,
+    # чтобы не трогать static/dist/ работающего приложения
+    shutil.copytree(SOURCE_DIR, output_dir / "static", ignore=shutil.ignore_patterns("dist"))
+    manifest = build_assets(SOURCE_DIR, output_dir / "static" / "dist")
+
+    pages = {output_dir / "index.html": render_index(manifest)}
+    for url, body in render_api().items():
+        pages[url_to_path(output_dir, url)] = body
+
+    for path, body in pages.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+
+    # Сжимаем все текстовые файлы, для которых еще нет сжатых версий
+    for path in sorted(output_dir.rglob("*")):
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES:
+            if not path.with_name(path.name + ".gz").exists():
+                write_precompressed(path)
+
+    return len(pages)
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else OUTPUT_DIR
+    try:
+        count = export_site(target)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Экспортировано страниц: {count}")
+    print(f"📁 Каталог: {target}")
@@ -1,21 +1,33 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 import json
 import re
 import os
 from pathlib import Path
 
+from assets import DIST_DIR, PrecompressedStaticFiles, asset_url_factory, load_asset_manifest
+from clusters import AnswerClusterer
+
 app = FastAPI(title="Онлайн курс Python 3.12", version="1.0.0")
 
 # Монтируем статические файлы
+# Собранные ресурсы (python assets.py) отдаются предсжатыми и кешируются навсегда.
+# Без сборки каталога нет, и запросы к /static/dist/ получают 404 от общего /static
+if DIST_DIR.is_dir():
+    app.mount("/static/dist", PrecompressedStaticFiles(directory=DIST_DIR), name="dist")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Настройка шаблонов
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["asset_url"] = asset_url_factory(load_asset_manifest())
+
+
+# Максимальная длина ответа в запросе на проверку
+MAX_SUBMITTED_ANSWER_LENGTH = 2000
 
 
 # Модели данных
@@ -47,7 +59,7 @@ class LessonResponse(BaseModel):
 
 class CheckAnswerRequest(BaseModel):
     task_id: str
-    answer: str
+    answer: str = Field(max_length=MAX_SUBMITTED_ANSWER_LENGTH)
 
 
 class CheckAnswerResponse(BaseModel):
@@ -57,6 +69,19 @@ class CheckAnswerResponse(BaseModel):
     attempts: int
 
 
+class AnswerCluster(BaseModel):
+    id: int
+    representative: str
+    count: int
+    wrong_count: int
+    samples: List[str]
+
+
+class AnswerClustersResponse(BaseModel):
+    task_id: str
+    clusters: List[AnswerCluster]
+
+
 # Функция для преобразования Markdown в HTML
 def markdown_to_html(text: str) -> str:
     """Преобразует Markdown-подобное форматирование в HTML"""
@@ -132,6 +157,18 @@ COURSE_DATA = load_course_data()
 # Хранилище попыток пользователей
 user_attempts: Dict[str, int] = {}
 
+# Кластеры похожих ответов по заданиям
+answer_clusters = AnswerClusterer()
+
+
+def find_task(task_id: str) -> Optional[Dict[str, Any]]:
+    """Находит задание по id"""
+    for lesson in COURSE_DATA["lessons"]:
+        for task in lesson["tasks"]:
+            if task["id"] == task_id:
+                return task
+    return None
+
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
@@ -178,17 +215,7 @@ async def get_lesson_by_index(lesson_index: int):
 async def check_answer(request: CheckAnswerRequest):
     """Проверить ответ на задание"""
     # Находим задание
-    task = None
-    lesson = None
-
-    for l in COURSE_DATA["lessons"]:
-        for t in l["tasks"]:
-            if t["id"] == request.task_id:
-                task = t
-                lesson = l
-                break
-        if task:
-            break
+    task = find_task(request.task_id)
 
     if not task:
         raise HTTPException(status_code=404, detail="Задание не найдено")
@@ -199,6 +226,9 @@ async def check_answer(request: CheckAnswerRequest):
     # Проверяем ответ
     correct = request.answer.strip().lower() == task["answer"].strip().lower()
 
+    # Запоминаем ответ для статистики похожих ответов
+    answer_clusters.add(request.task_id, request.answer, correct)
+
     return CheckAnswerResponse(
         correct=correct,
         expected=task["answer"],
@@ -227,6 +257,18 @@ async def get_lesson_theory(lesson_id: str):
     raise HTTPException(status_code=404, detail="Урок не найден")
 
 
+@app.get("/api/task/{task_id}/answer-clusters")
+async def get_answer_clusters(task_id: str, limit: int = Query(10, ge=1, le=100)):
+    """Получить самые частые группы неверных ответов на задание"""
+    if not find_task(task_id):
+        raise HTTPException(status_code=404, detail="Задание не найдено")
+
+    return AnswerClustersResponse(
+        task_id=task_id,
+        clusters=answer_clusters.top_wrong_clusters(task_id, limit)
+    )
+
+
 @app.get("/api/health")
 async def health_check():
     """Проверка здоровья API"""
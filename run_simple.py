@@ -5,6 +5,7 @@
 """
 import json
 import os
+import re
 from pathlib import Path
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
@@ -13,6 +14,14 @@ import webbrowser
 import time
 
 
+# Статические файлы, которые подключает шаблон
+STATIC_FILES = {
+    '/static/style.css': 'text/css',
+    '/static/app.css': 'text/css',
+    '/static/app.js': 'application/javascript',
+}
+
+
 class CourseHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         """Обработка GET запросов"""
@@ -21,8 +30,8 @@ class CourseHandler(BaseHTTPRequestHandler):
 
         if path == '/':
             self.serve_index()
-        elif path == '/static/style.css':
-            self.serve_css()
+        elif path in STATIC_FILES:
+            self.serve_static(path)
         elif path.startswith('/api/'):
             self.serve_api(path)
         else:
@@ -58,6 +67,7 @@ class CourseHandler(BaseHTTPRequestHandler):
             html_content = html_content.replace('{{ module.title }}', 'Модуль')
             html_content = html_content.replace('{{ topic.title }}', 'Тема')
             html_content = html_content.replace('{{ topic.id }}', 'topic-id')
+            html_content = re.sub(r"{{ asset_url\('([^']+)'\) }}", r'/static/\1', html_content)
 
             # Добавляем данные в HTML
             html_content = html_content.replace('</body>', f'''
@@ -75,16 +85,16 @@ class CourseHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error(500, f"Ошибка загрузки страницы: {str(e)}")
 
-    def serve_css(self):
-        """Отдает CSS файл"""
+    def serve_static(self, path):
+        """Отдает CSS/JS файл"""
         try:
-            with open('static/style.css', 'r', encoding='utf-8') as f:
-                css_content = f.read()
+            with open(path.lstrip('/'), 'r', encoding='utf-8') as f:
+                content = f.read()
 
             self.send_response(200)
-            self.send_header('Content-type', 'text/css')
+            self.send_header('Content-type', STATIC_FILES[path])
             self.end_headers()
-            self.wfile.write(css_content.encode('utf-8'))
+            self.wfile.write(content.encode('utf-8'))
 
         except Exception as e:
             self.send_error(404)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Тест сборки статических ресурсов
+"""
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from assets import IMMUTABLE_CACHE_CONTROL, PrecompressedStaticFiles, build_assets, minify_css, minify_js
+
+
+def test_minify():
+    """Проверяет минификацию CSS и JS"""
+    css = "/* комментарий */\n.a {\n    color: red;\n    margin: 0 auto;\n}\n"
+    assert minify_css(css) == ".a{color:red;margin:0 auto}"
+
+    js = "// комментарий\nfunction f() {\n    return 1;\n}\n\n"
+    assert minify_js(js) == "function f() {\nreturn 1;\n}\n"
+
+
+def test_minify_js_keeps_template_literals():
+    """Содержимое многострочных шаблонных строк не меняется"""
+    js = (
+        "    const html = `  \n"
+        "        <b>${x + `y`}</b>\n"
+        "// не комментарий\n"
+        "\n"
+        "    `;\n"
+        "    const s = '`'; // кавычка в строке не открывает шаблон\n"
+        "    // комментарий\n"
+    )
+    assert minify_js(js) == (
+        "const html = `  \n"
+        "        <b>${x + `y`}</b>\n"
+        "// не комментарий\n"
+        "\n"
+        "    `;\n"
+        "const s = '`'; // кавычка в строке не открывает шаблон\n"
+    )
+
+
+def test_build_assets(tmp_path):
+    """Проверяет имена с хешем, сжатые версии и манифест"""
+    source_dir = tmp_path / "static"
+    source_dir.mkdir()
+    for name in ("style.css", "app.css", "app.js"):
+        source = Path("static") / name
+        (source_dir / name).write_text(source.read_text(encoding='utf-8'), encoding='utf-8')
+
+    dist_dir = source_dir / "dist"
+    manifest = build_assets(source_dir, dist_dir)
+
+    assert set(manifest) == {"style.css", "app.css", "app.js"}
+    for url in manifest.values():
+        built = dist_dir / url.rsplit('/', 1)[-1]
+        assert built.exists()
+        compressed = built.with_name(built.name + ".gz")
+        assert gzip.decompress(compressed.read_bytes()) == built.read_bytes()
+
+    with open(dist_dir / "manifest.json", 'r', encoding='utf-8') as f:
+        assert json.load(f) == manifest
+
+    # Повторная сборка без изменений дает те же имена
+    assert build_assets(source_dir, dist_dir) == manifest
+
+
+def test_build_assets_brotli(tmp_path):
+    """Проверяет .br версии собранных файлов и их раздачу"""
+    brotli = pytest.importorskip("brotli")
+
+    source_dir = tmp_path / "static"
+    source_dir.mkdir()
+    for name in ("style.css", "app.css", "app.js"):
+        source = Path("static") / name
+        (source_dir / name).write_text(source.read_text(encoding='utf-8'), encoding='utf-8')
+
+    dist_dir = source_dir / "dist"
+    manifest = build_assets(source_dir, dist_dir)
+
+    app = FastAPI()
+    app.mount("/static/dist", PrecompressedStaticFiles(directory=dist_dir), name="dist")
+    client = TestClient(app)
+
+    for url in manifest.values():
+        built = dist_dir / url.rsplit('/', 1)[-1]
+        compressed = built.with_name(built.name + ".br")
+        assert brotli.decompress(compressed.read_bytes()) == built.read_bytes()
+
+        with client.stream("GET", url, headers={"Accept-Encoding": "gzip, br"}) as response:
+            assert response.headers["content-encoding"] == "br"
+            assert b"".join(response.iter_raw()) == compressed.read_bytes()
+
+
+GZIP_BODY = gzip.compress(b"plain")
+
+
+def make_client(tmp_path):
+    """Приложение с каталогом собранных ресурсов"""
+    dist_dir = tmp_path / "dist"
+    dist_dir.mkdir()
+    (dist_dir / "app.0123456789ab.js").write_bytes(b"plain")
+    (dist_dir / "app.0123456789ab.js.gz").write_bytes(GZIP_BODY)
+    (dist_dir / "app.0123456789ab.js.br").write_bytes(b"brotli")
+    (dist_dir / "style.0123456789ab.css").write_bytes(b"css")
+    (dist_dir / "style.0123456789ab.css.gz").write_bytes(gzip.compress(b"css"))
+    (dist_dir / "manifest.json").write_text("{}", encoding='utf-8')
+
+    app = FastAPI()
+    app.mount("/static/dist", PrecompressedStaticFiles(directory=dist_dir), name="dist")
+    return TestClient(app)
+
+
+def test_encoding_negotiation(tmp_path):
+    """Проверяет выбор кодировки по Accept-Encoding"""
+    client = make_client(tmp_path)
+    url = "/static/dist/app.0123456789ab.js"
+
+    cases = [
+        ("gzip, deflate, br", "br", b"brotli"),
+        ("gzip", "gzip", GZIP_BODY),
+        ("br;q=0.5, gzip", "gzip", GZIP_BODY),
+        ("br;q=0, gzip;q=0", None, b"plain"),
+        ("gzip;q=0", None, b"plain"),
+        ("*", "br", b"brotli"),
+        ("*;q=0.1, br;q=0", "gzip", GZIP_BODY),
+        ("identity", None, b"plain"),
+    ]
+    for accept_encoding, encoding, body in cases:
+        # Читаем тело без распаковки, чтобы видеть, какой файл был отдан
+        with client.stream("GET", url, headers={"Accept-Encoding": accept_encoding}) as response:
+            assert response.status_code == 200, accept_encoding
+            assert response.headers.get("content-encoding") == encoding, accept_encoding
+            assert response.headers["content-type"].startswith("text/javascript"), accept_encoding
+            assert b"".join(response.iter_raw()) == body, accept_encoding
+
+
+def test_cache_headers(tmp_path):
+    """Кешируются навсегда только файлы с хешем в имени"""
+    client = make_client(tmp_path)
+
+    for url in ("/static/dist/style.0123456789ab.css", "/static/dist/app.0123456789ab.js"):
+        for accept_encoding in ("gzip", "identity"):
+            response = client.get(url, headers={"Accept-Encoding": accept_encoding})
+            assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+            assert response.headers["vary"] == "Accept-Encoding"
+
+    response = client.get("/static/dist/manifest.json")
+    assert response.status_code == 200
+    assert "immutable" not in response.headers.get("cache-control", "")
+
+    assert client.get("/static/dist/missing.0123456789ab.js").status_code == 404
+
+
+def test_not_modified(tmp_path):
+    """Повторный запрос с If-None-Match получает 304"""
+    client = make_client(tmp_path)
+    url = "/static/dist/style.0123456789ab.css"
+
+    for accept_encoding in ("gzip", "identity"):
+        headers = {"Accept-Encoding": accept_encoding}
+        etag = client.get(url, headers=headers).headers["etag"]
+        response = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Тест кластеризации похожих ответов
+"""
+from fastapi.testclient import TestClient
+
+import clusters
+from clusters import MAX_ANSWER_LENGTH, AnswerClusterer, minhash, shingles, tokenize_answer
+
+
+def test_tokenize_answer():
+    """Проверяет разбиение кода и текста на токены"""
+    assert tokenize_answer("print( 'Hi' )") == ["print", "(", "'hi'", ")"]
+    assert {"незакрытая", "строка"} <= set(tokenize_answer('"незакрытая строка'))
+
+
+def test_similar_answers_share_cluster():
+    """Похожие неверные ответы собираются в один кластер"""
+    clusterer = AnswerClusterer()
+    first = clusterer.add("t1", "for i in range(10): print(i)", False)
+    second = clusterer.add("t1", "for i in range(10):  print(i)", False)
+    other = clusterer.add("t1", "while True: pass", False)
+    correct = clusterer.add("t1", "len", True)
+
+    assert first.id == second.id
+    assert other.id != first.id
+
+    clusters = clusterer.top_wrong_clusters("t1")
+    assert [cluster["wrong_count"] for cluster in clusters] == [2, 1]
+    assert correct.id not in [cluster["id"] for cluster in clusters]
+    assert clusterer.top_wrong_clusters("unknown") == []
+
+
+def test_one_token_change_merges():
+    """Ответы, отличающиеся одним токеном, попадают в один кластер"""
+    clusterer = AnswerClusterer()
+    first = clusterer.add("t1", "numbers = [x * 2 for x in range(10) if x % 2 == 0]", False)
+    second = clusterer.add("t1", "numbers = [x * 3 for x in range(10) if x % 2 == 0]", False)
+
+    assert first.id == second.id
+    assert first.count == 2
+    assert len(first.samples) == 2
+
+
+def test_moderate_change_stays_separate():
+    """Заметно отличающиеся ответы не объединяются (сходство ниже порога)"""
+    clusterer = AnswerClusterer()
+    first = clusterer.add("t1", "for i in range(10): print(i)", False)
+    second = clusterer.add("t1", "for i in range(5, 20): total += i", False)
+
+    assert first.id != second.id
+    assert len(clusterer.top_wrong_clusters("t1")) == 2
+
+
+def test_answers_are_truncated_before_hashing():
+    """Длинные ответы обрезаются до хеширования и хранятся обрезанными"""
+    clusterer = AnswerClusterer()
+    prefix = "x = 1 + " * MAX_ANSWER_LENGTH
+    cluster = clusterer.add("t1", prefix + "tail_that_is_never_hashed", False)
+
+    truncated = prefix[:MAX_ANSWER_LENGTH]
+    assert cluster.signature == minhash(shingles(tokenize_answer(truncated)))
+    assert cluster.representative == truncated
+    assert cluster.samples == [truncated]
+
+
+def test_representative_is_wrong_answer():
+    """Верный ответ не становится представителем кластера неверных ответов"""
+    clusterer = AnswerClusterer()
+    clusterer.add("t1", "print('hello')", True)
+    clusterer.add("t1", "print( 'hello' )", False)
+    clusterer.add("t1", "print ('hello')", False)
+
+    [cluster] = clusterer.top_wrong_clusters("t1")
+    assert cluster["count"] == 3
+    assert cluster["wrong_count"] == 2
+    assert cluster["representative"] == "print( 'hello' )"
+    assert cluster["samples"] == ["print( 'hello' )", "print ('hello')"]
+
+
+def test_clusters_per_task_are_capped(monkeypatch):
+    """Новые непохожие ответы сверх лимита не создают кластеров"""
+    monkeypatch.setattr(clusters, "MAX_CLUSTERS_PER_TASK", 2)
+    clusterer = AnswerClusterer()
+
+    first = clusterer.add("t1", "for i in range(10): print(i)", False)
+    clusterer.add("t1", "while True: pass", False)
+    assert clusterer.add("t1", "import os", False) is None
+    assert len(clusterer.tasks["t1"].clusters) == 2
+
+    # Похожие на существующие кластеры ответы по-прежнему учитываются
+    assert clusterer.add("t1", "for i in range(10):  print(i)", False) is first
+    assert first.wrong_count == 2
+
+    # Лимит действует для каждого задания отдельно
+    assert clusterer.add("t2", "import os", False) is not None
+
+
+def test_answer_clusters_endpoint():
+    """Проверяет /api/check-answer и /api/task/{task_id}/answer-clusters"""
+    import main
+
+    main.answer_clusters = main.AnswerClusterer()
+    client = TestClient(main.app)
+    task_id = main.COURSE_DATA["lessons"][0]["tasks"][0]["id"]
+
+    for answer in ["numbers = [x * 2 for x in data]", "numbers = [x * 3 for x in data]", "while True: pass"]:
+        response = client.post("/api/check-answer", json={"task_id": task_id, "answer": answer})
+        assert response.status_code == 200
+        assert response.json()["correct"] is False
+
+    response = client.get(f"/api/task/{task_id}/answer-clusters")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["task_id"] == task_id
+    assert [cluster["wrong_count"] for cluster in data["clusters"]] == [2, 1]
+    for cluster in data["clusters"]:
+        assert set(cluster) == {"id", "representative", "count", "wrong_count", "samples"}
+
+    response = client.get(f"/api/task/{task_id}/answer-clusters", params={"limit": 1})
+    assert len(response.json()["clusters"]) == 1
+
+    for limit in (0, -1, 101):
+        response = client.get(f"/api/task/{task_id}/answer-clusters", params={"limit": limit})
+        assert response.status_code == 422
+
+    assert client.get("/api/task/unknown/answer-clusters").status_code == 404
+
+
+def test_check_answer_rejects_oversized_answer():
+    """Слишком длинный ответ отклоняется до проверки и кластеризации"""
+    import main
+
+    main.answer_clusters = main.AnswerClusterer()
+    client = TestClient(main.app)
+    task_id = main.COURSE_DATA["lessons"][0]["tasks"][0]["id"]
+
+    answer = "x" * (main.MAX_SUBMITTED_ANSWER_LENGTH + 1)
+    response = client.post("/api/check-answer", json={"task_id": task_id, "answer": answer})
+    assert response.status_code == 422
+    assert task_id not in main.answer_clusters.tasks
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Тест экспорта курса в статический сайт
+"""
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from export_static import EXPORT_MARKER, check_output_dir, export_site
+from main import COURSE_DATA
+
+
+def test_export_site(tmp_path):
+    """Проверяет, что экспорт содержит главную страницу и ответы API"""
+    output_dir = tmp_path / "public"
+    export_site(output_dir)
+
+    index_page = output_dir / "index.html"
+    assert index_page.exists()
+    assert gzip.decompress((output_dir / "index.html.gz").read_bytes()) == index_page.read_bytes()
+
+    with open(output_dir / "api" / "modules.json", 'r', encoding='utf-8') as f:
+        assert json.load(f) == {"modules": COURSE_DATA["modules"]}
+
+    for index, lesson in enumerate(COURSE_DATA["lessons"]):
+        lesson_id = lesson["id"]
+        with open(output_dir / "api" / "lessons" / f"{lesson_id}.json", 'r', encoding='utf-8') as f:
+            assert json.load(f) == lesson
+        with open(output_dir / "api" / "lessons" / "by-index" / f"{index}.json", 'r', encoding='utf-8') as f:
+            assert json.load(f) == lesson
+        with open(output_dir / "api" / "lesson" / lesson_id / "theory.json", 'r', encoding='utf-8') as f:
+            assert json.load(f) == {"theory": lesson["theory"]}
+        with open(output_dir / "api" / "lesson" / lesson_id / "tasks.json", 'r', encoding='utf-8') as f:
+            assert json.load(f) == {"tasks": lesson["tasks"]}
+
+
+def test_export_keeps_source_dist(tmp_path):
+    """Экспорт не пересобирает static/dist/ исходного дерева"""
+    dist_dir = Path("static") / "dist"
+    before = sorted(p.name for p in dist_dir.iterdir()) if dist_dir.exists() else None
+
+    export_site(tmp_path / "public")
+
+    after = sorted(p.name for p in dist_dir.iterdir()) if dist_dir.exists() else None
+    assert after == before
+    assert (tmp_path / "public" / "static" / "dist" / "manifest.json").exists()
+
+
+def test_check_output_dir_refuses_unsafe_dirs(tmp_path):
+    """Проверка каталога отклоняет пути, которые нельзя очищать"""
+    foreign = tmp_path / "foreign"
+    foreign.mkdir()
+    (foreign / "keep.txt").write_text("data", encoding='utf-8')
+    regular_file = tmp_path / "file.txt"
+    regular_file.write_text("data", encoding='utf-8')
+
+    for output_dir in (Path("."), Path(".."), Path.cwd(), Path("static"), Path("static") / "dist",
+                       foreign, regular_file):
+        with pytest.raises(ValueError):
+            check_output_dir(output_dir)
+
+    # Новый, пустой и ранее экспортированный каталоги допустимы
+    check_output_dir(tmp_path / "new")
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    check_output_dir(empty)
+    (foreign / EXPORT_MARKER).touch()
+    check_output_dir(foreign)
+
+
+def test_export_refuses_foreign_dir(tmp_path):
+    """Экспорт не удаляет каталог, созданный не им"""
+    foreign = tmp_path / "foreign"
+    foreign.mkdir()
+    (foreign / "keep.txt").write_text("data", encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        export_site(foreign)
+    assert (foreign / "keep.txt").exists()
+
+
+def test_export_overwrites_previous_export(tmp_path):
+    """Каталог прошлого экспорта можно перезаписать"""
+    previous = tmp_path / "public"
+    export_site(previous)
+    (previous / "stale.json").write_text("{}", encoding='utf-8')
+    export_site(previous)
+    assert not (previous / "stale.json").exists()
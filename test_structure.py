@@ -17,6 +17,8 @@ def test_project_structure():
         "requirements.txt",
         "templates/index.html",
         "static/style.css",
+        "static/app.css",
+        "static/app.js",
         "data/modules/manifest.json"
     ]
 